@@ -1,104 +1,71 @@
 import dash
 from dash import dcc, html
-from dash.dependencies import Input, Output
-import plotly.graph_objs as go
-import pandas as pd
-import math
+from dash.dependencies import Input, Output, State
+from core import overview_figure, scatter_3d_figure, data_table
 
-# Data for planetary positions (simplified circular orbits)
-planets = [
-    {"name": "Mercury", "distance": 57.9, "color": "gray"},
-    {"name": "Venus", "distance": 108.2, "color": "yellow"},
-    {"name": "Earth", "distance": 149.6, "color": "blue"},
-    {"name": "Mars", "distance": 227.9, "color": "red"},
-    {"name": "Jupiter", "distance": 778.3, "color": "orange"},
-    {"name": "Saturn", "distance": 1427.0, "color": "gold"},
-    {"name": "Uranus", "distance": 2871.0, "color": "lightblue"},
-    {"name": "Neptune", "distance": 4497.1, "color": "darkblue"},
-]
+# Initialize the Dash app
+app = dash.Dash(__name__)
+app.title = "3D CSS Solar System Viewer"
 
-# Generate positions for circular orbits
-def generate_positions(planets):
-    positions = []
-    for i, planet in enumerate(planets):
-        angle = i * (2 * math.pi / len(planets))  # Evenly spaced angles
-        x = planet["distance"] * math.cos(angle)
-        y = planet["distance"] * math.sin(angle)
-        positions.append({"name": planet["name"], "x": x, "y": y, "color": planet["color"]})
-    return positions
+# Pages of the app: path -> (navbar label, view builder)
+PAGES = {
+    '/': ("Overview", lambda user_date_str: dcc.Graph(
+        figure=overview_figure(user_date_str), style={'height': '80vh', 'width': '100%'})),
+    '/3d': ("3D", lambda user_date_str: dcc.Graph(
+        figure=scatter_3d_figure(user_date_str), style={'height': '80vh', 'width': '100%'})),
+    '/data': ("Data", lambda user_date_str: data_panel(user_date_str)),
+}
 
-positions = generate_positions(planets)
-df_planets = pd.DataFrame(positions)
 
-# Initialize Dash app
-app = dash.Dash(__name__)
+def data_panel(user_date_str):
+    table = data_table(user_date_str)
+    return html.Table([
+        html.Thead(html.Tr([html.Th(column) for column in table.columns])),
+        html.Tbody([html.Tr([html.Td(value) for value in row]) for row in table.itertuples(index=False)]),
+    ], style={'margin': '0 auto', 'color': 'white'})
 
-# Layout
+
+# Layout shared by every page: navbar, date controls and the current view
 app.layout = html.Div([
-    html.H1("Solar System Visualization", style={"textAlign": "center"}),
-    dcc.Graph(
-        id="solar-system-plot",
-        style={"height": "80vh"},
-    ),
-])
+    dcc.Location(id='url'),
 
-# Callback to update the 2D plot
-@app.callback(
-    Output("solar-system-plot", "figure"),
-    Input("solar-system-plot", "id")
-)
-def update_plot(_):
-    # Create 2D scatter plot for planets and their orbits
-    traces = []
+    html.Div(id="navbar", children=[
+        html.H1("3D CSS Solar System"),
+        html.Div([dcc.Link(label, href=path, style={'marginRight': '15px'})
+                  for path, (label, _) in PAGES.items()]),
+    ], style={'textAlign': 'center'}),
 
-    # Add orbits as circular lines
-    for planet in planets:
-        theta = [i * (2 * math.pi / 100) for i in range(101)]  # Create points for a circle
-        x_orbit = [planet["distance"] * math.cos(t) for t in theta]
-        y_orbit = [planet["distance"] * math.sin(t) for t in theta]
-        orbit_trace = go.Scatter(
-            x=x_orbit,
-            y=y_orbit,
-            mode="lines",
-            line=dict(color="lightgray", dash="dot"),
-            name=f"{planet['name']} Orbit",
-        )
-        traces.append(orbit_trace)
+    html.Div(id="controls", children=[
+        html.Label("Enter the date (YYYY-MM-DD):", style={'fontWeight': 'bold', 'marginRight': '10px'}),
+        dcc.Input(id='user_date', type='text', placeholder="YYYY-MM-DD", style={'marginRight': '10px', 'padding': '5px'}),
+        html.Button("Calculate", id='calculate_button', n_clicks=0, style={'padding': '5px 10px', 'backgroundColor': '#4CAF50', 'color': 'white', 'border': 'none'}),
+    ], style={'textAlign': 'center', 'marginBottom': '20px'}),
 
-    # Add planets
-    for _, row in df_planets.iterrows():
-        planet_trace = go.Scatter(
-            x=[row["x"]],
-            y=[row["y"]],
-            mode="markers+text",
-            marker=dict(size=10, color=row["color"]),
-            text=row["name"],
-            textposition="top center",
-        )
-        traces.append(planet_trace)
+    html.Div(id='status_output', style={'textAlign': 'center', 'color': 'red', 'marginBottom': '20px'}),
 
-    # Add the Sun at the origin
-    sun_trace = go.Scatter(
-        x=[0],
-        y=[0],
-        mode="markers+text",
-        marker=dict(size=15, color="yellow"),
-        text="Sun",
-        textposition="top center",
-    )
-    traces.append(sun_trace)
+    html.Div(id='page_content'),
+], style={'backgroundColor': '#000', 'color': 'white', 'minHeight': '100vh'})
 
-    # Layout configuration
-    layout = go.Layout(
-        xaxis=dict(title="X (millions of km)", showgrid=False, zeroline=False),
-        yaxis=dict(title="Y (millions of km)", showgrid=False, zeroline=False),
-        margin=dict(l=0, r=0, b=0, t=0),
-        showlegend=False,
-        plot_bgcolor="black"
-    )
+# Callback for rendering the current page for the entered date
+@app.callback(
+    [Output('status_output', 'children'),
+     Output('page_content', 'children')],
+    [Input('url', 'pathname'),
+     Input('calculate_button', 'n_clicks')],
+    [State('user_date', 'value')]
+)
+def render_page(pathname, n_clicks, user_date_str):
+    if (pathname or '/') not in PAGES:
+        return f"Page not found: {pathname}", None
+    _, view = PAGES[pathname or '/']
+    if not user_date_str:
+        return "Enter a date and click 'Calculate'.", None
 
-    return go.Figure(data=traces, layout=layout)
+    try:
+        return "Coordinates successfully updated!", view(user_date_str)
+    except Exception as e:
+        return f"An error occurred: {str(e)}", None
 
 # Run the app
-if __name__ == "__main__":
-    app.run_server(debug=True)
+if __name__ == '__main__':
+    app.run(debug=True)
@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import pandas as pd
+import numpy as np
+
+# Epoch of the base coordinates in planetary_coordinates_2025_01_16.csv
+EPOCH = datetime(2025, 1, 16)
+
+# Checkpoints are kept every CHECKPOINT_INTERVAL_DAYS from the epoch
+CHECKPOINT_INTERVAL_DAYS = 365
+
+# How many checkpoints stay in memory before the least recently used is dropped.
+# There is no disk tier: the rotation is closed form, so recomputing a dropped
+# checkpoint is far cheaper than reading it back from a file.
+MAX_CHECKPOINTS_IN_MEMORY = 32
+
+
+class CheckpointStore:
+    # Keeps body states ('Planet', 'X (AU)', 'Y (AU)', 'Z (AU)') at regular
+    # epochs so a query only propagates from the nearest known state instead
+    # of from EPOCH. The last queried state is kept too, so scrubbing the date
+    # forwards or backwards only advances by the step between two queries.
+    # Queries are serialised by an internal lock, so one store can be shared
+    # by every callback thread.
+
+    def __init__(self, planet_info, coordinates, epoch=EPOCH,
+                 interval_days=CHECKPOINT_INTERVAL_DAYS,
+                 max_in_memory=MAX_CHECKPOINTS_IN_MEMORY):
+        self.epoch = epoch
+        self.interval_days = interval_days
+        self.max_in_memory = max_in_memory
+
+        # Per-planet constants, aligned with the order of planet_info
+        self.planets = list(planet_info['Planet'])
+        velocity = planet_info['Orbital Velocity (km/s)'].to_numpy(dtype=float) * 86400
+        perimeter = planet_info['Perimeter (10^6)(km)'].to_numpy(dtype=float) * 1e6
+        self.degrees_per_day = velocity / perimeter * 360
+        self.cos_inclination = np.cos(np.radians(
+            planet_info['Orbital Inclination (degrees)'].to_numpy(dtype=float)))
+
+        base = coordinates.set_index('Planet').loc[self.planets]
+        base_state = base[['X (AU)', 'Y (AU)', 'Z (AU)']].to_numpy(dtype=float)
+
+        # Checkpoint index -> state array, most recently used last. Index 0 is
+        # the epoch itself and is always served from _base_state.
+        self._checkpoints = OrderedDict()
+        self._base_state = base_state
+
+        # (date, state) of the previous query
+        self._last = (epoch, base_state)
+        self._lock = threading.Lock()
+
+    def _checkpoint_date(self, index):
+        return self.epoch + timedelta(days=index * self.interval_days)
+
+    def _propagate(self, state, days):
+        # Rotate every body in its orbital plane by the angle covered in `days`
+        angle_radians = np.radians(self.degrees_per_day * days)
+        cos_a, sin_a = np.cos(angle_radians), np.sin(angle_radians)
+        x, y, z = state[:, 0], state[:, 1], state[:, 2]
+        return np.column_stack((x * cos_a - y * sin_a, x * sin_a + y * cos_a, z))
+
+    def get_checkpoint(self, index):
+        if index == 0:
+            return self._base_state
+        if index in self._checkpoints:
+            self._checkpoints.move_to_end(index)
+            return self._checkpoints[index]
+
+        # The rotation is closed form, so any checkpoint is one step from the epoch
+        state = self._propagate(self._base_state, index * self.interval_days)
+        self._checkpoints[index] = state
+        while len(self._checkpoints) > self.max_in_memory:
+            self._checkpoints.popitem(last=False)
+        return state
+
+    def get_state(self, user_date):
+        with self._lock:
+            return self._get_state(user_date)
+
+    def _get_state(self, user_date):
+        # Start from whichever is closer: the previous query or the nearest checkpoint
+        days_from_epoch = (user_date - self.epoch).days
+        index = int(round(days_from_epoch / self.interval_days))
+        checkpoint_date = self._checkpoint_date(index)
+        last_date, last_state = self._last
+
+        if abs((user_date - last_date).days) <= abs((user_date - checkpoint_date).days):
+            start_date, start_state = last_date, last_state
+        else:
+            start_date, start_state = checkpoint_date, self.get_checkpoint(index)
+
+        state = self._propagate(start_state, (user_date - start_date).days)
+        self._last = (user_date, state)
+        return state
+
+    def get_new_coordinates(self, user_date):
+        state = self.get_state(user_date)
+        return pd.DataFrame({
+            'Planet': self.planets,
+            'New_X (AU)': state[:, 0],
+            'New_Y (AU)': state[:, 1],
+            'New_Z (AU)': state[:, 2] * self.cos_inclination
+        })
@@ -0,0 +1,112 @@
+import os
+from datetime import datetime
+from functools import lru_cache
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+from checkpoints import CheckpointStore
+
+# Shared compute layer for every view of the app: the CSVs are loaded once per
+# process and computed coordinates are cached, so all pages reuse each other's work
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Load data
+planet_info = pd.read_csv(os.path.join(DATA_DIR, 'modified_planets.csv'))
+coordinates = pd.read_csv(os.path.join(DATA_DIR, 'planetary_coordinates_2025_01_16.csv'))
+
+# Number of dates whose coordinates stay cached in memory
+COORDINATES_CACHE_SIZE = 1024
+
+# Number of dates whose figures stay cached per view. Figures are kept as plain
+# dicts, which are far smaller than go.Figure objects and skip plotly's
+# validation when Dash serialises them, but still much larger than coordinates.
+FIGURE_CACHE_SIZE = 32
+
+checkpoint_store = CheckpointStore(planet_info, coordinates)
+
+
+@lru_cache(maxsize=COORDINATES_CACHE_SIZE)
+def _cached_coordinates(user_date_str):
+    user_date = datetime.strptime(user_date_str, "%Y-%m-%d")
+    return checkpoint_store.get_new_coordinates(user_date)
+
+
+def get_new_coordinates(user_date_str):
+    # Copy so callers can modify the result without touching the cache
+    return _cached_coordinates(user_date_str).copy()
+
+
+def _orbit_traces():
+    # Orbits do not depend on the date, so they are built once
+    traces = []
+    t = np.linspace(0, 2 * np.pi, 100)
+    for _, planet_row in coordinates.iterrows():
+        orbit_x = planet_row['X (AU)'] * np.cos(t) - planet_row['Y (AU)'] * np.sin(t)
+        orbit_y = planet_row['X (AU)'] * np.sin(t) + planet_row['Y (AU)'] * np.cos(t)
+        traces.append(go.Scatter(
+            x=orbit_x, y=orbit_y,
+            mode='lines',
+            line=dict(dash='dot', width=1, color='gray'),
+            name=f"{planet_row['Planet']} Orbit",
+            showlegend=False
+        ))
+    return traces
+
+
+ORBIT_TRACES = _orbit_traces()
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def overview_figure(user_date_str):
+    new_coords = _cached_coordinates(user_date_str)
+    fig = go.Figure(data=ORBIT_TRACES)
+
+    # Add the Sun at the center
+    fig.add_trace(go.Scatter(
+        x=[0], y=[0], mode='markers+text',
+        marker=dict(size=30, color='yellow'),
+        name='Sun',
+        text='Sun',
+        textposition='bottom center'
+    ))
+
+    # Add each planet's current position
+    for _, row in new_coords.iterrows():
+        fig.add_trace(go.Scatter(
+            x=[row['New_X (AU)']],
+            y=[row['New_Y (AU)']],
+            mode='markers+text',
+            marker=dict(size=10, symbol='circle'),
+            name=row['Planet'],
+            text=row['Planet'],
+            textposition='top center'
+        ))
+
+    fig.update_layout(
+        title=f"Solar System on {user_date_str}",
+        xaxis=dict(title="X (AU)", range=[-35, 35], zeroline=False),
+        yaxis=dict(title="Y (AU)", range=[-35, 35], zeroline=False),
+        paper_bgcolor="#000",
+        plot_bgcolor="#111",
+        font=dict(color="white"),
+        showlegend=True
+    )
+    return fig.to_dict()
+
+
+@lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def scatter_3d_figure(user_date_str):
+    new_coords = _cached_coordinates(user_date_str)
+    fig = px.scatter_3d(new_coords, x='New_X (AU)', y='New_Y (AU)', z='New_Z (AU)', color='Planet',
+                        title="Planetary Positions in 3D", labels={"New_X (AU)": "X (AU)", "New_Y (AU)": "Y (AU)", "New_Z (AU)": "Z (AU)"})
+    fig.update_layout(scene=dict(xaxis_title='X (AU)', yaxis_title='Y (AU)', zaxis_title='Z (AU)'))
+    return fig.to_dict()
+
+
+def data_table(user_date_str):
+    # Planet facts next to the computed coordinates, one row per planet
+    table = planet_info[['Planet', 'Distance from Sun (10^6 km)', 'Orbital Period (days)',
+                         'Orbital Velocity (km/s)', 'Orbital Inclination (degrees)']]
+    return table.merge(_cached_coordinates(user_date_str).round(3), on='Planet')
@@ -0,0 +1,411 @@
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+# Load test for the Dash app in this folder. Starts it locally and
+# replays callback traffic through Dash's _dash-update-component endpoint the
+# same way the browser client does, then reports latency, throughput, payload
+# size and memory growth of the server processes. Runs fully offline (Linux).
+#
+# Zoom and pan are not replayed: plotly handles relayouts in the browser and
+# app.py has no relayoutData callback, so they never reach the server.
+#
+#   python loadtest.py app.py --users 20 --duration 60
+#   python loadtest.py app.py --workers 4 --users 50   (needs gunicorn)
+
+APPS = ['app.py']
+
+# Pages visited by the simulated users (see PAGES in app.py)
+PAGES = ['/', '/3d', '/data']
+
+# Relative weight of each kind of user action in the replayed traffic
+TRAFFIC_MIX = {'date': 0.7, 'range': 0.3}
+
+# Dates are drawn around the coordinate epoch, as users tend to browse near today
+DATE_CENTER = datetime(2025, 1, 16)
+DATE_SPREAD_DAYS = 20 * 365
+
+# Number of consecutive days requested by one 'range' action (scrubbing a date)
+RANGE_STEPS = 10
+
+# How often server memory is sampled while the test runs (seconds)
+MEMORY_SAMPLE_INTERVAL = 0.5
+
+# Script used to boot a single app with the Flask development server
+SERVER_RUNNER = '''
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("loadtest_app", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+run = getattr(module.app, "run", None) or module.app.run_server
+run(host="127.0.0.1", port=int(sys.argv[2]), debug=False, threaded=True)
+'''
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app_file, port, workers):
+    app_dir = os.path.dirname(os.path.abspath(app_file))
+    if workers > 1:
+        module = os.path.splitext(os.path.basename(app_file))[0]
+        command = [sys.executable, '-m', 'gunicorn', '--workers', str(workers),
+                   '--bind', f'127.0.0.1:{port}', f'{module}:app.server']
+    else:
+        command = [sys.executable, '-c', SERVER_RUNNER, os.path.abspath(app_file), str(port)]
+    # The dev server logs every request to stderr, so send it to a file rather
+    # than a pipe that would fill up and stall the server mid-test
+    log = tempfile.TemporaryFile()
+    process = subprocess.Popen(command, cwd=app_dir, stdout=subprocess.DEVNULL, stderr=log)
+    process.log = log
+    return process
+
+
+def wait_for_server(process, port, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            process.log.seek(0)
+            error = process.log.read().decode(errors='replace').strip()
+            raise RuntimeError(f"App exited during startup:\n{error}")
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            connection.request('GET', '/_dash-layout')
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"App did not answer on port {port} within {timeout}s")
+
+
+def process_tree(pid):
+    # The server process plus every descendant (gunicorn workers)
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as stat:
+                parent = int(stat.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+    tree, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending.extend(children.get(current, []))
+    return tree
+
+
+def rss_bytes(pid):
+    total = 0
+    for member in process_tree(pid):
+        try:
+            with open(f'/proc/{member}/status') as status:
+                for line in status:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return total
+
+
+class MemorySampler(threading.Thread):
+    def __init__(self, pid):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.samples = []
+        self.stop_event = threading.Event()
+
+    def run(self):
+        while not self.stop_event.is_set():
+            self.samples.append(rss_bytes(self.pid))
+            self.stop_event.wait(MEMORY_SAMPLE_INTERVAL)
+
+    def stop(self):
+        self.stop_event.set()
+        self.join()
+        self.samples.append(rss_bytes(self.pid))
+
+
+# Stand-in for the Dash renderer: reads the callback map from the server and
+# builds update requests exactly like the browser client would send them
+
+def parse_outputs(output):
+    # "..a.children...b.figure.." for multiple outputs, "a.children" for one
+    multi = output.startswith('..')
+    parts = output.strip('.').split('...') if multi else [output]
+    outputs = []
+    for part in parts:
+        component_id, prop = part.rsplit('.', 1)
+        outputs.append({'id': component_id, 'property': prop})
+    return outputs if multi else outputs[0]
+
+
+class DashClient:
+    def __init__(self, port):
+        self.port = port
+        self.connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        self.n_clicks = 0
+        # Page the user is on; picked once per action so a range scrubs one page
+        self.page = PAGES[0]
+
+    def get_json(self, path):
+        self.connection.request('GET', path)
+        response = self.connection.getresponse()
+        return json.loads(response.read())
+
+    def post_callback(self, payload):
+        body = json.dumps(payload)
+        start = time.perf_counter()
+        self.connection.request('POST', '/_dash-update-component', body=body,
+                                headers={'Content-Type': 'application/json'})
+        response = self.connection.getresponse()
+        data = response.read()
+        latency = time.perf_counter() - start
+        return response.status, latency, len(body), len(data)
+
+    def value_for(self, prop, component_id, date_str):
+        if prop == 'n_clicks':
+            return self.n_clicks
+        if prop == 'value':
+            return date_str
+        if prop == 'id':
+            return component_id
+        if prop == 'pathname':
+            return self.page
+        return None
+
+    def build_payload(self, callback, triggered_prop, date_str):
+        def props(entries):
+            return [{'id': entry['id'], 'property': entry['property'],
+                     'value': self.value_for(entry['property'], entry['id'], date_str)}
+                    for entry in entries]
+
+        inputs = props(callback['inputs'])
+        changed = [f"{entry['id']}.{entry['property']}" for entry in callback['inputs']
+                   if entry['property'] == triggered_prop]
+        return {
+            'output': callback['output'],
+            'outputs': parse_outputs(callback['output']),
+            'inputs': inputs,
+            'changedPropIds': changed,
+            'state': props(callback.get('state', [])),
+        }
+
+
+def find_callback(dependencies, prop):
+    for callback in dependencies:
+        if callback.get('clientside_function'):
+            continue
+        if any(entry['property'] == prop for entry in callback['inputs']):
+            return callback
+    return None
+
+
+def random_date(rng):
+    offset = rng.randint(-DATE_SPREAD_DAYS, DATE_SPREAD_DAYS)
+    return DATE_CENTER + timedelta(days=offset)
+
+
+def user_actions(client, dependencies, rng):
+    # Which user actions the app can actually serve, and the requests for each
+    click_prop = 'n_clicks'
+    click_callback = find_callback(dependencies, click_prop)
+    if click_callback is None:
+        # Apps without a date button only redraw on load
+        click_prop = 'id'
+        click_callback = find_callback(dependencies, click_prop)
+
+    def date_action():
+        client.n_clicks += 1
+        date = random_date(rng)
+        return [client.build_payload(click_callback, click_prop, f"{date:%Y-%m-%d}")]
+
+    def range_action():
+        start = random_date(rng)
+        payloads = []
+        for step in range(RANGE_STEPS):
+            client.n_clicks += 1
+            date = start + timedelta(days=step)
+            payloads.append(client.build_payload(click_callback, click_prop, f"{date:%Y-%m-%d}"))
+        return payloads
+
+    actions = {}
+    if click_callback:
+        actions['date'] = date_action
+        actions['range'] = range_action
+    return actions
+
+
+class Results:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def record(self, action, status, latency, sent, received):
+        with self.lock:
+            if status in (200, 204):
+                self.latencies.setdefault(action, []).append(latency)
+            else:
+                self.errors[action] = self.errors.get(action, 0) + 1
+            self.request_bytes += sent
+            self.response_bytes += received
+
+
+def run_user(port, dependencies, deadline, think_time, results, skipped, rng):
+    # Every user draws from its own generator so a seed replays the same traffic
+    client = DashClient(port)
+    actions = user_actions(client, dependencies, rng)
+    for action in TRAFFIC_MIX:
+        if action not in actions:
+            skipped.add(action)
+    if not actions:
+        return
+    names = list(actions)
+    weights = [TRAFFIC_MIX[name] for name in names]
+    # Report each page separately when the app routes on the URL
+    uses_pages = any(entry['property'] == 'pathname'
+                     for callback in dependencies for entry in callback['inputs'])
+
+    while time.time() < deadline:
+        action = rng.choices(names, weights)[0]
+        client.page = rng.choice(PAGES)
+        label = f"{action} {client.page}" if uses_pages else action
+        for payload in actions[action]():
+            try:
+                status, latency, sent, received = client.post_callback(payload)
+            except (OSError, http.client.HTTPException):
+                client.connection.close()
+                status, latency, sent, received = 0, 0.0, 0, 0
+            results.record(label, status, latency, sent, received)
+        if think_time:
+            time.sleep(rng.expovariate(1 / think_time))
+
+
+def percentile(sorted_values, fraction):
+    # Nearest-rank percentile
+    if not sorted_values:
+        return float('nan')
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(results, elapsed, memory_samples):
+    rows = {}
+    all_latencies = []
+    for action, latencies in sorted(results.latencies.items()):
+        all_latencies.extend(latencies)
+        rows[action] = sorted(latencies)
+    rows['all'] = sorted(all_latencies)
+
+    report = {'elapsed_s': elapsed, 'actions': {}}
+    for action, latencies in rows.items():
+        errors = sum(results.errors.values()) if action == 'all' else results.errors.get(action, 0)
+        report['actions'][action] = {
+            'requests': len(latencies),
+            'errors': errors,
+            'throughput_rps': len(latencies) / elapsed if elapsed else 0.0,
+            'p50_ms': percentile(latencies, 0.50) * 1000,
+            'p95_ms': percentile(latencies, 0.95) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000,
+        }
+    total = len(all_latencies) + sum(results.errors.values())
+    report['request_bytes_avg'] = results.request_bytes / total if total else 0
+    report['response_bytes_avg'] = results.response_bytes / total if total else 0
+    report['response_bytes_total'] = results.response_bytes
+    report['memory_start_mb'] = memory_samples[0] / 2**20
+    report['memory_peak_mb'] = max(memory_samples) / 2**20
+    report['memory_end_mb'] = memory_samples[-1] / 2**20
+    report['memory_growth_mb'] = (memory_samples[-1] - memory_samples[0]) / 2**20
+    return report
+
+
+def print_report(app_file, users, workers, report, skipped):
+    print(f"\nLoad test: {app_file}, {users} users, {workers} worker(s), {report['elapsed_s']:.1f}s")
+    print("Traffic mix: " + ", ".join(f"{action} {weight:.0%}" for action, weight in TRAFFIC_MIX.items())
+          + " (zoom/pan is client-side only and not replayed)")
+    print(f"{'action':<14}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for action, row in report['actions'].items():
+        print(f"{action:<14}{row['requests']:>10}{row['errors']:>8}{row['throughput_rps']:>10.1f}"
+              f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}")
+    print(f"Payload: {report['request_bytes_avg']:.0f} B sent / {report['response_bytes_avg']:.0f} B "
+          f"received per request, {report['response_bytes_total'] / 2**20:.1f} MB received in total")
+    print(f"Server memory: {report['memory_start_mb']:.1f} MB at start, {report['memory_peak_mb']:.1f} MB peak, "
+          f"{report['memory_end_mb']:.1f} MB at end ({report['memory_growth_mb']:+.1f} MB)")
+    if skipped:
+        print(f"Skipped (no matching callback in this app): {', '.join(sorted(skipped))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay Dash callback traffic against a local app")
+    parser.add_argument('app', choices=APPS, help="Dash app to start")
+    parser.add_argument('--users', type=int, default=10, help="Concurrent simulated users")
+    parser.add_argument('--duration', type=float, default=30, help="Test length in seconds")
+    parser.add_argument('--think-time', type=float, default=0.0,
+                        help="Mean pause between user actions in seconds (0 = none)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Server workers; more than 1 runs the app under gunicorn")
+    parser.add_argument('--startup-timeout', type=float, default=60)
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Seed for reproducible traffic; user i uses seed + i")
+    parser.add_argument('--json', dest='json_path', help="Also write the report to this file")
+    args = parser.parse_args()
+
+    port = free_port()
+    app_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), args.app)
+    server = start_server(app_file, port, args.workers)
+    try:
+        wait_for_server(server, port, args.startup_timeout)
+        dependencies = DashClient(port).get_json('/_dash-dependencies')
+
+        sampler = MemorySampler(server.pid)
+        sampler.start()
+        results, skipped = Results(), set()
+        start = time.time()
+        deadline = start + args.duration
+        users = [threading.Thread(target=run_user,
+                                  args=(port, dependencies, deadline, args.think_time, results, skipped,
+                                        random.Random(None if args.seed is None else args.seed + i)))
+                 for i in range(args.users)]
+        for user in users:
+            user.start()
+        for user in users:
+            user.join()
+        elapsed = time.time() - start
+        sampler.stop()
+
+        report = summarize(results, elapsed, sampler.samples)
+        print_report(args.app, args.users, args.workers, report, skipped)
+        if args.json_path:
+            with open(args.json_path, 'w') as output:
+                json.dump(report, output, indent=2)
+    except RuntimeError as e:
+        print(f"An error occurred: {str(e)}")
+        sys.exit(1)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == '__main__':
+    main()